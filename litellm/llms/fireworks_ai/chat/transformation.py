@@ -1,11 +1,119 @@
+import time
 import types
-from typing import Literal, Optional, Tuple, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, Literal, Optional, Tuple, Union
 
 from litellm.secret_managers.main import get_secret_str
 
 from ...openai.chat.gpt_transformation import OpenAIGPTConfig
 from ..embed.fireworks_ai_transformation import FireworksAIEmbeddingConfig
 
+_FIREWORKS_SUPPORTED_OPENAI_PARAMS: Tuple[str, ...] = (
+    "stream",
+    "tools",
+    "tool_choice",
+    "max_completion_tokens",
+    "max_tokens",
+    "temperature",
+    "top_p",
+    "top_k",
+    "frequency_penalty",
+    "presence_penalty",
+    "n",
+    "stop",
+    "response_format",
+    "user",
+    "logprobs",
+    "prompt_truncate_length",
+    "context_length_exceeded_behavior",
+)
+_FIREWORKS_SUPPORTED_OPENAI_PARAMS_SET = frozenset(_FIREWORKS_SUPPORTED_OPENAI_PARAMS)
+
+
+def _map_tool_choice(value: Any, optional_params: dict) -> None:
+    if value == "required":
+        # relevant issue: https://github.com/BerriAI/litellm/issues/4416
+        optional_params["tool_choice"] = "any"
+    else:
+        # pass through the value of tool choice
+        optional_params["tool_choice"] = value
+
+
+def _map_response_format(value: Any, optional_params: dict) -> None:
+    if value.get("type", None) == "json_schema":
+        optional_params["response_format"] = {
+            "type": "json_object",
+            "schema": value["json_schema"]["schema"],
+        }
+    elif value is not None:
+        optional_params["response_format"] = value
+
+
+def _map_max_completion_tokens(value: Any, optional_params: dict) -> None:
+    optional_params["max_tokens"] = value
+
+
+_FIREWORKS_ENV_CREDENTIALS_TTL_SECONDS = 60
+_fireworks_env_credentials: Optional[Tuple[float, str, Optional[str]]] = None
+
+
+def _get_fireworks_env_credentials() -> Tuple[str, Optional[str]]:
+    """
+    Returns the (api_base, api_key) read from the environment / secret manager.
+
+    Cached for `_FIREWORKS_ENV_CREDENTIALS_TTL_SECONDS`, since this is resolved on every request.
+    Call `_invalidate_fireworks_env_credentials()` to pick up changed values immediately.
+    """
+    global _fireworks_env_credentials
+    current_time = time.monotonic()
+    if (
+        _fireworks_env_credentials is not None
+        and current_time < _fireworks_env_credentials[0]
+    ):
+        return _fireworks_env_credentials[1], _fireworks_env_credentials[2]
+
+    api_base = (
+        get_secret_str("FIREWORKS_API_BASE") or "https://api.fireworks.ai/inference/v1"
+    )
+    api_key = (
+        get_secret_str("FIREWORKS_API_KEY")
+        or get_secret_str("FIREWORKS_AI_API_KEY")
+        or get_secret_str("FIREWORKSAI_API_KEY")
+        or get_secret_str("FIREWORKS_AI_TOKEN")
+    )
+    _fireworks_env_credentials = (
+        current_time + _FIREWORKS_ENV_CREDENTIALS_TTL_SECONDS,
+        api_base,
+        api_key,
+    )
+    return api_base, api_key
+
+
+def _invalidate_fireworks_env_credentials() -> None:
+    global _fireworks_env_credentials
+    _fireworks_env_credentials = None
+
+
+@lru_cache(maxsize=512)
+def _add_fireworks_model_prefix(model: str) -> str:
+    """
+    `llama-v3p1-8b-instruct` -> `accounts/fireworks/models/llama-v3p1-8b-instruct`
+
+    Cached, since a deployment only sees a handful of distinct model names.
+    """
+    if model.startswith("accounts/"):
+        return model
+    return f"accounts/fireworks/models/{model}"
+
+
+# params that need translation - everything else in _FIREWORKS_SUPPORTED_OPENAI_PARAMS_SET is passed through as-is
+# kept at module level, since `get_config()` would pick up a dict stored on the class
+_FIREWORKS_PARAM_HANDLERS: Dict[str, Callable[[Any, dict], None]] = {
+    "tool_choice": _map_tool_choice,
+    "response_format": _map_response_format,
+    "max_completion_tokens": _map_max_completion_tokens,
+}
+
 
 class FireworksAIConfig(OpenAIGPTConfig):
     """
@@ -50,6 +158,7 @@ class FireworksAIConfig(OpenAIGPTConfig):
         prompt_truncate_length: Optional[int] = None,
         context_length_exceeded_behavior: Optional[Literal["error", "truncate"]] = None,
     ) -> None:
+        # set on the class, not the instance - `get_config()` reads from `cls.__dict__`
         locals_ = locals().copy()
         for key, value in locals_.items():
             if key != "self" and value is not None:
@@ -60,25 +169,7 @@ class FireworksAIConfig(OpenAIGPTConfig):
         return super().get_config()
 
     def get_supported_openai_params(self, model: str):
-        return [
-            "stream",
-            "tools",
-            "tool_choice",
-            "max_completion_tokens",
-            "max_tokens",
-            "temperature",
-            "top_p",
-            "top_k",
-            "frequency_penalty",
-            "presence_penalty",
-            "n",
-            "stop",
-            "response_format",
-            "user",
-            "logprobs",
-            "prompt_truncate_length",
-            "context_length_exceeded_behavior",
-        ]
+        return list(_FIREWORKS_SUPPORTED_OPENAI_PARAMS)
 
     def map_openai_params(
         self,
@@ -88,25 +179,11 @@ class FireworksAIConfig(OpenAIGPTConfig):
         drop_params: bool,
     ) -> dict:
 
-        supported_openai_params = self.get_supported_openai_params(model=model)
         for param, value in non_default_params.items():
-            if param == "tool_choice":
-                if value == "required":
-                    # relevant issue: https://github.com/BerriAI/litellm/issues/4416
-                    optional_params["tool_choice"] = "any"
-                else:
-                    # pass through the value of tool choice
-                    optional_params["tool_choice"] = value
-            elif (
-                param == "response_format" and value.get("type", None) == "json_schema"
-            ):
-                optional_params["response_format"] = {
-                    "type": "json_object",
-                    "schema": value["json_schema"]["schema"],
-                }
-            elif param == "max_completion_tokens":
-                optional_params["max_tokens"] = value
-            elif param in supported_openai_params:
+            handler = _FIREWORKS_PARAM_HANDLERS.get(param)
+            if handler is not None:
+                handler(value, optional_params)
+            elif param in _FIREWORKS_SUPPORTED_OPENAI_PARAMS_SET:
                 if value is not None:
                     optional_params[param] = value
         return optional_params
@@ -117,17 +194,10 @@ class FireworksAIConfig(OpenAIGPTConfig):
         if FireworksAIEmbeddingConfig().is_fireworks_embedding_model(model=model):
             # fireworks embeddings models do not require accounts/fireworks prefix https://docs.fireworks.ai/api-reference/creates-an-embedding-vector-representing-the-input-text
             pass
-        elif not model.startswith("accounts/"):
-            model = f"accounts/fireworks/models/{model}"
-        api_base = (
-            api_base
-            or get_secret_str("FIREWORKS_API_BASE")
-            or "https://api.fireworks.ai/inference/v1"
-        )  # type: ignore
-        dynamic_api_key = api_key or (
-            get_secret_str("FIREWORKS_API_KEY")
-            or get_secret_str("FIREWORKS_AI_API_KEY")
-            or get_secret_str("FIREWORKSAI_API_KEY")
-            or get_secret_str("FIREWORKS_AI_TOKEN")
-        )
-        return model, api_base, dynamic_api_key
+        else:
+            model = _add_fireworks_model_prefix(model)
+        if not api_base or not api_key:
+            env_api_base, env_api_key = _get_fireworks_env_credentials()
+            api_base = api_base or env_api_base
+            api_key = api_key or env_api_key
+        return model, api_base, api_key
@@ -4159,6 +4159,10 @@ class Router:
         try:
             if deployment_idx is not None:
                 item = self.model_list.pop(deployment_idx)
+                if self.router_budget_logger is not None:
+                    self.router_budget_logger.remove_deployment_from_provider_cache(
+                        model_id=id
+                    )
                 return item
             else:
                 return None
@@ -19,7 +19,9 @@ anthropic:
 """
 
 import asyncio
+import time
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, TypedDict, Union
 
 import litellm
@@ -36,7 +38,6 @@ from litellm.types.router import (
     DeploymentTypedDict,
     GenericBudgetConfigType,
     GenericBudgetInfo,
-    LiteLLM_Params,
     RouterErrors,
 )
 from litellm.types.utils import StandardLoggingPayload
@@ -44,11 +45,53 @@ from litellm.types.utils import StandardLoggingPayload
 if TYPE_CHECKING:
     from opentelemetry.trace import Span as _Span
 
+    from litellm.integrations.prometheus import PrometheusLogger
+
     Span = _Span
 else:
     Span = Any
+    PrometheusLogger = Any
 
 DEFAULT_REDIS_SYNC_INTERVAL = 1
+# seconds a batched spend read is re-used by async_filter_deployments
+DEFAULT_SPEND_SNAPSHOT_TTL = 1
+
+
+def _spend_to_float(spend: Any) -> float:
+    return float(spend) if spend else 0.0
+
+
+def _get_validated_budget_info(
+    budget_name: str, budget_limit: Any, time_period: Any
+) -> GenericBudgetInfo:
+    """
+    Build a GenericBudgetInfo, raising a ValueError for an invalid budget_limit / time_period
+
+    GenericBudgetInfo is a NamedTuple and does not validate or coerce its fields, so this is done here
+    """
+    if not isinstance(time_period, str):
+        raise ValueError(
+            f"Invalid time_period for {budget_name}: {time_period!r}, expected a duration string e.g. '1d'"
+        )
+    try:
+        duration_in_seconds(time_period)
+    except Exception as e:
+        raise ValueError(
+            f"Invalid time_period for {budget_name}: {time_period!r}, {str(e)}"
+        ) from e
+
+    if budget_limit is None or isinstance(budget_limit, bool):
+        raise ValueError(
+            f"Invalid budget_limit for {budget_name}: {budget_limit!r}, expected a number"
+        )
+    try:
+        _budget_limit = float(budget_limit)
+    except (TypeError, ValueError) as e:
+        raise ValueError(
+            f"Invalid budget_limit for {budget_name}: {budget_limit!r}, expected a number"
+        ) from e
+
+    return GenericBudgetInfo(time_period=time_period, budget_limit=_budget_limit)
 
 
 class RouterBudgetLimiting(CustomLogger):
@@ -61,14 +104,35 @@ class RouterBudgetLimiting(CustomLogger):
         ] = None,
     ):
         self.router_cache = router_cache
-        self.redis_increment_operation_queue: List[RedisPipelineIncrementOperation] = []
+        # spend_key -> increment not yet pushed to Redis, accumulated per key as spend is logged
+        self.redis_pending_increments: Dict[str, RedisPipelineIncrementOperation] = {}
         asyncio.create_task(self.periodic_sync_in_memory_spend_with_redis())
         self.provider_budget_config: Optional[GenericBudgetConfigType] = (
             provider_budget_config
         )
         self.deployment_budget_config: Optional[GenericBudgetConfigType] = None
+        # model_info.id -> ((model, custom_llm_provider, api_base), llm provider), avoids resolving the provider for every deployment on every request
+        # provider is None if it could not be resolved - see `_get_cached_llm_provider_for_deployment`
+        self._deployment_provider_cache: Dict[
+            str, Tuple[Tuple[Any, Any, Any], Optional[str]]
+        ] = {}
+        # budget time_period -> ttl in seconds, avoids re-parsing the duration on every success event
+        self._ttl_seconds_by_time_period: Dict[str, int] = {}
+        # spend cache keys, built once from the budget configs - see `_init_spend_keys`
+        self._provider_spend_keys: Dict[str, str] = {}
+        self._deployment_spend_keys: Dict[str, str] = {}
+        self._all_spend_keys: List[str] = []
+        # tuple(sorted(cache_keys)) -> (time.monotonic() of the read, spend_key -> spend) - see `_get_current_spends`
+        self._spend_snapshots: Dict[Tuple[str, ...], Tuple[float, Dict[str, Any]]] = {}
+        # tuple(sorted(cache_keys)) -> in-flight spend read, concurrent requests for the same keys await the same read
+        self._in_flight_spend_reads: Dict[Tuple[str, ...], asyncio.Future] = {}
+        # bumped whenever spend is written - reads that were in flight during a write don't store a snapshot
+        self._spend_snapshot_generation: int = 0
+        # set the first time a PrometheusLogger is found in the litellm callbacks
+        self._prometheus_logger: Optional[PrometheusLogger] = None
         self._init_provider_budgets()
         self._init_deployment_budgets(model_list=model_list)
+        self._init_spend_keys()
 
         # Add self to litellm callbacks if it's a list
         if isinstance(litellm.callbacks, list):
@@ -97,6 +161,10 @@ class RouterBudgetLimiting(CustomLogger):
         if len(healthy_deployments) == 0:
             return healthy_deployments
 
+        # Don't do any filtering if no provider / deployment budgets are configured
+        if not self.provider_budget_config and not self.deployment_budget_config:
+            return healthy_deployments
+
         potential_deployments: List[Dict] = []
 
         # Extract the parent OpenTelemetry span for tracing
@@ -104,22 +172,26 @@ class RouterBudgetLimiting(CustomLogger):
             request_kwargs
         )
 
-        # Build combined cache keys for both provider and deployment budgets
-        cache_keys = []
+        # Single pass over the deployments - record which provider / deployment budget applies to each one
         provider_configs: Dict[str, GenericBudgetInfo] = {}
         deployment_configs: Dict[str, GenericBudgetInfo] = {}
+        # (deployment, provider, model_id) - provider / model_id are None when no budget is set for them
+        deployment_budget_checks: List[
+            Tuple[Dict[str, Any], Optional[str], Optional[str]]
+        ] = []
 
         for deployment in healthy_deployments:
+            budgeted_provider: Optional[str] = None
+            budgeted_model_id: Optional[str] = None
+
             # Check provider budgets
             if self.provider_budget_config:
-                provider = self._get_llm_provider_for_deployment(deployment)
+                provider = self._get_cached_llm_provider_for_deployment(deployment)
                 if provider is not None:
                     budget_config = self._get_budget_config_for_provider(provider)
                     if budget_config is not None:
                         provider_configs[provider] = budget_config
-                        cache_keys.append(
-                            f"provider_spend:{provider}:{budget_config.time_period}"
-                        )
+                        budgeted_provider = provider
 
             # Check deployment budgets
             if self.deployment_budget_config:
@@ -128,26 +200,33 @@ class RouterBudgetLimiting(CustomLogger):
                     budget_config = self._get_budget_config_for_deployment(model_id)
                     if budget_config is not None:
                         deployment_configs[model_id] = budget_config
-                        cache_keys.append(
-                            f"deployment_spend:{model_id}:{budget_config.time_period}"
-                        )
+                        budgeted_model_id = model_id
+
+            deployment_budget_checks.append(
+                (deployment, budgeted_provider, budgeted_model_id)
+            )
+
+        # Build combined cache keys for both provider and deployment budgets - one key per provider / deployment
+        cache_keys = [self._provider_spend_keys[p] for p in provider_configs] + [
+            self._deployment_spend_keys[m] for m in deployment_configs
+        ]
 
         # Single cache read for all spend values
+        # skipped when none of the deployments have a provider / deployment budget
         if len(cache_keys) > 0:
-            _current_spends = await self.router_cache.async_batch_get_cache(
-                keys=cache_keys,
+            current_spends = await self._get_current_spends(
+                cache_keys=cache_keys,
                 parent_otel_span=parent_otel_span,
             )
-            current_spends: List = _current_spends or [0.0] * len(cache_keys)
 
             # Map spends to their respective keys
-            spend_map: Dict[str, float] = {}
-            for idx, key in enumerate(cache_keys):
-                spend_map[key] = float(current_spends[idx] or 0.0)
+            spend_map: Dict[str, float] = dict(
+                zip(cache_keys, map(_spend_to_float, current_spends))
+            )
 
             potential_deployments, deployment_above_budget_info = (
                 self._filter_out_deployments_above_budget(
-                    healthy_deployments=healthy_deployments,
+                    deployment_budget_checks=deployment_budget_checks,
                     provider_configs=provider_configs,
                     deployment_configs=deployment_configs,
                     spend_map=spend_map,
@@ -164,10 +243,89 @@ class RouterBudgetLimiting(CustomLogger):
         else:
             return healthy_deployments
 
+    async def _get_current_spends(
+        self, cache_keys: List[str], parent_otel_span: Optional[Span]
+    ) -> List:
+        """
+        Batch read the current spend for `cache_keys`.
+
+        A read is re-used for `DEFAULT_SPEND_SNAPSHOT_TTL` seconds, and concurrent requests for the same keys share one read.
+        Requests for different keys never wait on each other's reads.
+        Snapshots are dropped whenever spend is written or synced from Redis - see `_invalidate_spend_snapshots`.
+
+        Snapshots are keyed on the sorted keys, so the order of the deployments doesn't matter.
+        Returns the spends in the order of `cache_keys`.
+        """
+        snapshot_key = tuple(sorted(cache_keys))
+        snapshot = self._spend_snapshots.get(snapshot_key)
+        if (
+            snapshot is not None
+            and time.monotonic() - snapshot[0] < DEFAULT_SPEND_SNAPSHOT_TTL
+        ):
+            spend_by_key = snapshot[1]
+            return [spend_by_key[key] for key in cache_keys]
+
+        spend_read = self._in_flight_spend_reads.get(snapshot_key)
+        if spend_read is None:
+            spend_read = asyncio.ensure_future(
+                self._read_current_spends(
+                    snapshot_key=snapshot_key,
+                    parent_otel_span=parent_otel_span,
+                )
+            )
+            self._in_flight_spend_reads[snapshot_key] = spend_read
+            spend_read.add_done_callback(
+                partial(self._remove_in_flight_spend_read, snapshot_key)
+            )
+        # shielded - a cancelled request should not cancel the read other requests are waiting on
+        spend_by_key = await asyncio.shield(spend_read)
+        return [spend_by_key[key] for key in cache_keys]
+
+    async def _read_current_spends(
+        self,
+        snapshot_key: Tuple[str, ...],
+        parent_otel_span: Optional[Span],
+    ) -> Dict[str, Any]:
+        """
+        Batch read the spend for the (sorted) `snapshot_key` keys, returns spend_key -> spend
+        """
+        current_time = time.monotonic()
+        snapshot_generation = self._spend_snapshot_generation
+        _current_spends = await self.router_cache.async_batch_get_cache(
+            keys=list(snapshot_key),
+            parent_otel_span=parent_otel_span,
+        )
+        current_spends: List = _current_spends or [0.0] * len(snapshot_key)
+        spend_by_key: Dict[str, Any] = dict(zip(snapshot_key, current_spends))
+        # spend was written while this read was in flight - it may already be stale, don't re-use it
+        if snapshot_generation == self._spend_snapshot_generation:
+            self._spend_snapshots[snapshot_key] = (current_time, spend_by_key)
+        return spend_by_key
+
+    def _remove_in_flight_spend_read(
+        self, snapshot_key: Tuple[str, ...], spend_read: asyncio.Future
+    ):
+        if self._in_flight_spend_reads.get(snapshot_key) is spend_read:
+            del self._in_flight_spend_reads[snapshot_key]
+        if not spend_read.cancelled():
+            # every waiter receives the error - mark it as retrieved even if they were all cancelled
+            spend_read.exception()
+
+    def _invalidate_spend_snapshots(self):
+        """
+        Drop the spend snapshots used by `_get_current_spends`, call this after spend is written to the cache
+        """
+        self._spend_snapshot_generation += 1
+        self._spend_snapshots.clear()
+        # reads started before the write may return the old spend - later requests start a new read instead of joining them
+        self._in_flight_spend_reads.clear()
+
     def _filter_out_deployments_above_budget(
         self,
         potential_deployments: List[Dict[str, Any]],
-        healthy_deployments: List[Dict[str, Any]],
+        deployment_budget_checks: List[
+            Tuple[Dict[str, Any], Optional[str], Optional[str]]
+        ],
         provider_configs: Dict[str, GenericBudgetInfo],
         deployment_configs: Dict[str, GenericBudgetInfo],
         spend_map: Dict[str, float],
@@ -178,6 +336,9 @@ class RouterBudgetLimiting(CustomLogger):
             - Provider budget
             - Deployment budget
 
+        `deployment_budget_checks` is a list of (deployment, provider, model_id), built in `async_filter_deployments`.
+        provider / model_id are None if that deployment has no provider / deployment budget.
+
         Returns:
             Tuple[List[Dict[str, Any]], str]:
                 - A tuple containing the filtered deployments
@@ -185,49 +346,38 @@ class RouterBudgetLimiting(CustomLogger):
         """
         # Filter deployments based on both provider and deployment budgets
         deployment_above_budget_info: str = ""
-        for deployment in healthy_deployments:
-            is_within_budget = True
-
+        for deployment, provider, model_id in deployment_budget_checks:
             # Check provider budget
-            if self.provider_budget_config:
-                provider = self._get_llm_provider_for_deployment(deployment)
-                if provider in provider_configs:
-                    config = provider_configs[provider]
-                    current_spend = spend_map.get(
-                        f"provider_spend:{provider}:{config.time_period}", 0.0
-                    )
-                    self._track_provider_remaining_budget_prometheus(
-                        provider=provider,
-                        spend=current_spend,
-                        budget_limit=config.budget_limit,
-                    )
+            if provider is not None:
+                config = provider_configs[provider]
+                current_spend = spend_map.get(self._provider_spend_keys[provider], 0.0)
+                self._track_provider_remaining_budget_prometheus(
+                    provider=provider,
+                    spend=current_spend,
+                    budget_limit=config.budget_limit,
+                )
 
-                    if current_spend >= config.budget_limit:
-                        debug_msg = f"Exceeded budget for provider {provider}: {current_spend} >= {config.budget_limit}"
-                        deployment_above_budget_info += f"{debug_msg}\n"
-                        is_within_budget = False
-                        continue
+                if current_spend >= config.budget_limit:
+                    debug_msg = f"Exceeded budget for provider {provider}: {current_spend} >= {config.budget_limit}"
+                    deployment_above_budget_info += f"{debug_msg}\n"
+                    continue
 
             # Check deployment budget
-            if self.deployment_budget_config and is_within_budget:
-                _model_name = deployment.get("model_name")
-                _litellm_params = deployment.get("litellm_params") or {}
-                _litellm_model_name = _litellm_params.get("model")
-                model_id = deployment.get("model_info", {}).get("id")
-                if model_id in deployment_configs:
-                    config = deployment_configs[model_id]
-                    current_spend = spend_map.get(
-                        f"deployment_spend:{model_id}:{config.time_period}", 0.0
-                    )
-                    if current_spend >= config.budget_limit:
-                        debug_msg = f"Exceeded budget for deployment model_name: {_model_name}, litellm_params.model: {_litellm_model_name}, model_id: {model_id}: {current_spend} >= {config.budget_limit}"
-                        verbose_router_logger.debug(debug_msg)
-                        deployment_above_budget_info += f"{debug_msg}\n"
-                        is_within_budget = False
-                        continue
+            if model_id is not None:
+                config = deployment_configs[model_id]
+                current_spend = spend_map.get(
+                    self._deployment_spend_keys[model_id], 0.0
+                )
+                if current_spend >= config.budget_limit:
+                    _model_name = deployment.get("model_name")
+                    _litellm_params = deployment.get("litellm_params") or {}
+                    _litellm_model_name = _litellm_params.get("model")
+                    debug_msg = f"Exceeded budget for deployment model_name: {_model_name}, litellm_params.model: {_litellm_model_name}, model_id: {model_id}: {current_spend} >= {config.budget_limit}"
+                    verbose_router_logger.debug(debug_msg)
+                    deployment_above_budget_info += f"{debug_msg}\n"
+                    continue
 
-            if is_within_budget:
-                potential_deployments.append(deployment)
+            potential_deployments.append(deployment)
 
         return potential_deployments, deployment_above_budget_info
 
@@ -271,6 +421,7 @@ class RouterBudgetLimiting(CustomLogger):
         await self.router_cache.async_set_cache(
             key=spend_key, value=response_cost, ttl=ttl_seconds
         )
+        self._invalidate_spend_snapshots()
         await self.router_cache.async_set_cache(
             key=start_time_key, value=current_time, ttl=ttl_seconds
         )
@@ -285,19 +436,26 @@ class RouterBudgetLimiting(CustomLogger):
         Runs once the budget start time exists in Redis Cache (on the 2nd and subsequent requests to the same provider)
 
         - Increments the spend in memory cache (so spend instantly updated in memory)
-        - Queues the increment operation to Redis Pipeline (using batched pipeline to optimize performance. Using Redis for multi instance environment of LiteLLM)
+        - Adds the increment to the pending Redis increment for this key (pushed in a batched pipeline to optimize performance. Using Redis for multi instance environment of LiteLLM)
         """
         await self.router_cache.in_memory_cache.async_increment(
             key=spend_key,
             value=response_cost,
             ttl=ttl,
         )
-        increment_op = RedisPipelineIncrementOperation(
-            key=spend_key,
-            increment_value=response_cost,
-            ttl=ttl,
-        )
-        self.redis_increment_operation_queue.append(increment_op)
+        self._invalidate_spend_snapshots()
+        # no await between the read and the write below, so this can't interleave with `_push_in_memory_increments_to_redis`
+        pending_op = self.redis_pending_increments.get(spend_key)
+        if pending_op is None:
+            self.redis_pending_increments[spend_key] = RedisPipelineIncrementOperation(
+                key=spend_key,
+                increment_value=response_cost,
+                ttl=ttl,
+            )
+        else:
+            pending_op["increment_value"] += response_cost
+            # latest ttl reflects the remaining time in the budget window
+            pending_op["ttl"] = ttl
 
     async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
         """Original method now uses helper functions"""
@@ -319,9 +477,7 @@ class RouterBudgetLimiting(CustomLogger):
         budget_config = self._get_budget_config_for_provider(custom_llm_provider)
         if budget_config:
             # increment spend for provider
-            spend_key = (
-                f"provider_spend:{custom_llm_provider}:{budget_config.time_period}"
-            )
+            spend_key = self._provider_spend_keys[custom_llm_provider]
             start_time_key = f"provider_budget_start_time:{custom_llm_provider}"
             await self._increment_spend_for_key(
                 budget_config=budget_config,
@@ -333,9 +489,7 @@ class RouterBudgetLimiting(CustomLogger):
         deployment_budget_config = self._get_budget_config_for_deployment(model_id)
         if deployment_budget_config:
             # increment spend for specific deployment id
-            deployment_spend_key = (
-                f"deployment_spend:{model_id}:{deployment_budget_config.time_period}"
-            )
+            deployment_spend_key = self._deployment_spend_keys[model_id]
             deployment_start_time_key = f"deployment_budget_start_time:{model_id}"
             await self._increment_spend_for_key(
                 budget_config=deployment_budget_config,
@@ -352,7 +506,7 @@ class RouterBudgetLimiting(CustomLogger):
         response_cost: float,
     ):
         current_time = datetime.now(timezone.utc).timestamp()
-        ttl_seconds = duration_in_seconds(budget_config.time_period)
+        ttl_seconds = self._get_ttl_seconds(budget_config.time_period)
 
         budget_start = await self._get_or_set_budget_start_time(
             start_time_key=start_time_key,
@@ -389,32 +543,41 @@ class RouterBudgetLimiting(CustomLogger):
             )
 
         verbose_router_logger.debug(
-            f"Incremented spend for {spend_key} by {response_cost}"
+            "Incremented spend for %s by %s", spend_key, response_cost
         )
 
     async def periodic_sync_in_memory_spend_with_redis(self):
         """
         Handler that triggers sync_in_memory_spend_with_redis every DEFAULT_REDIS_SYNC_INTERVAL seconds
 
+        Runs on a fixed schedule - the time a sync takes is not added to the interval.
+        If a sync overruns the next deadline, the schedule restarts from the end of that sync instead of running back-to-back syncs.
+
         Required for multi-instance environment usage of provider budgets
         """
+        loop = asyncio.get_running_loop()
+        next_sync_time = loop.time() + DEFAULT_REDIS_SYNC_INTERVAL
         while True:
             try:
                 await self._sync_in_memory_spend_with_redis()
-                await asyncio.sleep(
-                    DEFAULT_REDIS_SYNC_INTERVAL
-                )  # Wait for DEFAULT_REDIS_SYNC_INTERVAL seconds before next sync
             except Exception as e:
                 verbose_router_logger.error(f"Error in periodic sync task: {str(e)}")
-                await asyncio.sleep(
-                    DEFAULT_REDIS_SYNC_INTERVAL
-                )  # Still wait DEFAULT_REDIS_SYNC_INTERVAL seconds on error before retrying
+
+            current_time = loop.time()
+            if next_sync_time <= current_time:
+                # sync overran the interval - skip the missed slot
+                next_sync_time = current_time + DEFAULT_REDIS_SYNC_INTERVAL
+            await asyncio.sleep(next_sync_time - current_time)
+            next_sync_time += DEFAULT_REDIS_SYNC_INTERVAL
 
     async def _push_in_memory_increments_to_redis(self):
         """
         How this works:
-        - async_log_success_event collects all provider spend increments in `redis_increment_operation_queue`
-        - This function pushes all increments to Redis in a batched pipeline to optimize performance
+        - async_log_success_event accumulates provider / deployment spend increments per key in `redis_pending_increments`
+        - This function drains the pending increments and pushes them to Redis in a batched pipeline (1 INCRBYFLOAT + EXPIRE per key)
+        - If the push fails, the increments are merged back into the pending increments and retried on the next sync - spend is not lost
+
+        Pending increments are drained before awaiting, so increments logged while the pipeline runs are pushed on the next sync.
 
         Only runs if Redis is initialized
         """
@@ -422,18 +585,39 @@ class RouterBudgetLimiting(CustomLogger):
             if not self.router_cache.redis_cache:
                 return  # Redis is not initialized
 
+            pending_increments = self.redis_pending_increments
+            self.redis_pending_increments = {}
+            increment_list = [
+                increment_op
+                for increment_op in pending_increments.values()
+                if increment_op["increment_value"] > 0
+            ]
+
             verbose_router_logger.debug(
                 "Pushing Redis Increment Pipeline for queue: %s",
-                self.redis_increment_operation_queue,
+                increment_list,
             )
-            if len(self.redis_increment_operation_queue) > 0:
-                asyncio.create_task(
-                    self.router_cache.redis_cache.async_increment_pipeline(
-                        increment_list=self.redis_increment_operation_queue,
+            if len(increment_list) > 0:
+                try:
+                    await self.router_cache.redis_cache.async_increment_pipeline(
+                        increment_list=increment_list,
                     )
-                )
-
-            self.redis_increment_operation_queue = []
+                # also re-queue if the sync task is cancelled mid-push
+                except BaseException:
+                    for increment_op in increment_list:
+                        pending_op = self.redis_pending_increments.get(
+                            increment_op["key"]
+                        )
+                        if pending_op is None:
+                            self.redis_pending_increments[increment_op["key"]] = (
+                                increment_op
+                            )
+                        else:
+                            # keep the newer ttl of the increment logged during the push
+                            pending_op["increment_value"] += increment_op[
+                                "increment_value"
+                            ]
+                    raise
 
         except Exception as e:
             verbose_router_logger.error(
@@ -449,7 +633,7 @@ class RouterBudgetLimiting(CustomLogger):
         - Use provider budgets in multi-instance environment, we use Redis to sync spend across all instances
 
         What this does:
-        1. Push all provider spend increments to Redis
+        1. Push all provider spend increments to Redis (awaited, so step 2 reads spend that includes them)
         2. Fetch all current provider spend from Redis to update in-memory cache
         """
 
@@ -462,43 +646,50 @@ class RouterBudgetLimiting(CustomLogger):
             await self._push_in_memory_increments_to_redis()
 
             # 2. Fetch all current provider spend from Redis to update in-memory cache
-            cache_keys = []
-
-            if self.provider_budget_config is not None:
-                for provider, config in self.provider_budget_config.items():
-                    if config is None:
-                        continue
-                    cache_keys.append(f"provider_spend:{provider}:{config.time_period}")
-
-            if self.deployment_budget_config is not None:
-                for model_id, config in self.deployment_budget_config.items():
-                    if config is None:
-                        continue
-                    cache_keys.append(
-                        f"deployment_spend:{model_id}:{config.time_period}"
-                    )
-
-            # Batch fetch current spend values from Redis
             redis_values = await self.router_cache.redis_cache.async_batch_get_cache(
-                key_list=cache_keys
+                key_list=self._all_spend_keys
             )
 
             # Update in-memory cache with Redis values
             if isinstance(redis_values, dict):  # Check if redis_values is a dictionary
-                for key, value in redis_values.items():
-                    if value is not None:
-                        await self.router_cache.in_memory_cache.async_set_cache(
-                            key=key, value=float(value)
-                        )
-                        verbose_router_logger.debug(
-                            f"Updated in-memory cache for {key}: {value}"
-                        )
+                # increments logged after the push are not in Redis yet - keep them in the in-memory spend
+                cache_list = [
+                    (key, float(value) + self._get_pending_increment_value(key))
+                    for key, value in redis_values.items()
+                    if value is not None
+                ]
+                await self.router_cache.in_memory_cache.async_set_cache_pipeline(
+                    cache_list=cache_list
+                )
+                verbose_router_logger.debug(
+                    "Updated in-memory cache with Redis values: %s", cache_list
+                )
+                self._invalidate_spend_snapshots()
 
         except Exception as e:
             verbose_router_logger.error(
                 f"Error syncing in-memory cache with Redis: {str(e)}"
             )
 
+    def _get_pending_increment_value(self, spend_key: str) -> float:
+        pending_op = self.redis_pending_increments.get(spend_key)
+        if pending_op is None:
+            return 0.0
+        return pending_op["increment_value"]
+
+    def _get_ttl_seconds(self, time_period: str) -> int:
+        """
+        Returns `duration_in_seconds(time_period)`, memoized per time_period
+
+        Month based periods (e.g. "1mo") depend on the current date, so they are not memoized.
+        """
+        ttl_seconds = self._ttl_seconds_by_time_period.get(time_period)
+        if ttl_seconds is None:
+            ttl_seconds = duration_in_seconds(time_period)
+            if not time_period.endswith("mo"):
+                self._ttl_seconds_by_time_period[time_period] = ttl_seconds
+        return ttl_seconds
+
     def _get_budget_config_for_deployment(
         self,
         model_id: str,
@@ -514,14 +705,60 @@ class RouterBudgetLimiting(CustomLogger):
             return None
         return self.provider_budget_config.get(provider, None)
 
+    def _get_cached_llm_provider_for_deployment(
+        self, deployment: Dict
+    ) -> Optional[str]:
+        """
+        Same as `_get_llm_provider_for_deployment`, but cached by `model_info.id`
+
+        The cache lives on the instance (not per request), so it is shared by every request routed through this router.
+        Failed lookups are cached too, so a misconfigured deployment is not re-resolved (and logged) on every request.
+        Deployments without a model id are resolved on every call - the router assigns an id to every deployment it loads.
+
+        An entry is only re-used while the params the provider is resolved from (model, custom_llm_provider, api_base) are unchanged,
+        since `Router.upsert_deployment` can update `litellm_params` under the same model id.
+        """
+        model_id = (deployment.get("model_info") or {}).get("id")
+        if model_id is None:
+            return self._get_llm_provider_for_deployment(deployment)
+
+        _litellm_params: Dict = deployment.get("litellm_params") or {}
+        provider_params = (
+            _litellm_params.get("model"),
+            _litellm_params.get("custom_llm_provider"),
+            _litellm_params.get("api_base"),
+        )
+        cached = self._deployment_provider_cache.get(model_id)
+        if cached is not None and cached[0] == provider_params:
+            return cached[1]
+
+        provider = self._get_llm_provider_for_deployment(deployment)
+        self._deployment_provider_cache[model_id] = (provider_params, provider)
+        return provider
+
+    def remove_deployment_from_provider_cache(self, model_id: str) -> None:
+        """
+        Drop the cached llm provider for a deployment - called by `Router.delete_deployment`
+        """
+        self._deployment_provider_cache.pop(model_id, None)
+
     def _get_llm_provider_for_deployment(self, deployment: Dict) -> Optional[str]:
-        try:
-            _litellm_params: LiteLLM_Params = LiteLLM_Params(
-                **deployment.get("litellm_params", {"model": ""})
+        # read the params get_llm_provider needs directly, instead of validating a full `LiteLLM_Params` object
+        _litellm_params: Dict = deployment.get("litellm_params") or {}
+        _model = _litellm_params.get("model")
+        if not _model or not isinstance(_model, str):
+            # get_llm_provider can't resolve a provider without a model - skip raising + catching the error
+            verbose_router_logger.error(
+                f"Error getting LLM provider for deployment: {deployment}"
             )
+            return None
+
+        try:
             _, custom_llm_provider, _, _ = litellm.get_llm_provider(
-                model=_litellm_params.model,
-                litellm_params=_litellm_params,
+                model=_model,
+                custom_llm_provider=_litellm_params.get("custom_llm_provider"),
+                api_base=_litellm_params.get("api_base"),
+                api_key=_litellm_params.get("api_key"),
             )
         except Exception:
             verbose_router_logger.error(
@@ -538,9 +775,10 @@ class RouterBudgetLimiting(CustomLogger):
 
         This is helpful for debugging and monitoring provider budget limits.
         """
-        from litellm.integrations.prometheus import PrometheusLogger
-
-        prometheus_logger = _get_prometheus_logger_from_callbacks()
+        if self._prometheus_logger is None:
+            # callbacks can be added after init - keep looking until a logger is found
+            self._prometheus_logger = _get_prometheus_logger_from_callbacks()
+        prometheus_logger = self._prometheus_logger
         if prometheus_logger:
             prometheus_logger.track_provider_remaining_budget(
                 provider=provider,
@@ -564,7 +802,7 @@ class RouterBudgetLimiting(CustomLogger):
         if budget_config is None:
             return None
 
-        spend_key = f"provider_spend:{provider}:{budget_config.time_period}"
+        spend_key = self._provider_spend_keys[provider]
 
         if self.router_cache.redis_cache:
             # use Redis as source of truth since that has spend across all instances
@@ -583,7 +821,7 @@ class RouterBudgetLimiting(CustomLogger):
         if budget_config is None:
             return None
 
-        spend_key = f"provider_spend:{provider}:{budget_config.time_period}"
+        spend_key = self._provider_spend_keys[provider]
         if self.router_cache.redis_cache:
             ttl_seconds = await self.router_cache.redis_cache.async_get_ttl(spend_key)
         else:
@@ -605,7 +843,7 @@ class RouterBudgetLimiting(CustomLogger):
         """
         spend_key = f"provider_spend:{provider}:{budget_config.time_period}"
         start_time_key = f"provider_budget_start_time:{provider}"
-        ttl_seconds = duration_in_seconds(budget_config.time_period)
+        ttl_seconds = self._get_ttl_seconds(budget_config.time_period)
         budget_start = await self.router_cache.async_get_cache(start_time_key)
         if budget_start is None:
             budget_start = datetime.now(timezone.utc).timestamp()
@@ -657,11 +895,17 @@ class RouterBudgetLimiting(CustomLogger):
                         f"No budget config found for provider {provider}, provider_budget_config: {self.provider_budget_config}"
                     )
 
-                if not isinstance(config, GenericBudgetInfo):
-                    self.provider_budget_config[provider] = GenericBudgetInfo(
-                        budget_limit=config.get("budget_limit"),
-                        time_period=config.get("time_period"),
-                    )
+                # validate directly constructed GenericBudgetInfo entries too, the NamedTuple does not validate its fields
+                if isinstance(config, GenericBudgetInfo):
+                    budget_limit, time_period = config.budget_limit, config.time_period
+                else:
+                    budget_limit = config.get("budget_limit")
+                    time_period = config.get("time_period")
+                self.provider_budget_config[provider] = _get_validated_budget_info(
+                    budget_name=f"provider {provider}",
+                    budget_limit=budget_limit,
+                    time_period=time_period,
+                )
                 asyncio.create_task(
                     self._init_provider_budget_in_cache(
                         provider=provider,
@@ -689,16 +933,20 @@ class RouterBudgetLimiting(CustomLogger):
             _budget_duration = _litellm_params.get("budget_duration")
 
             verbose_router_logger.debug(
-                f"Init Deployment Budget: max_budget: {_max_budget}, budget_duration: {_budget_duration}, model_id: {_model_id}"
+                "Init Deployment Budget: max_budget: %s, budget_duration: %s, model_id: %s",
+                _max_budget,
+                _budget_duration,
+                _model_id,
             )
             if (
                 _max_budget is not None
                 and _budget_duration is not None
                 and _model_id is not None
             ):
-                _budget_config = GenericBudgetInfo(
-                    time_period=_budget_duration,
+                _budget_config = _get_validated_budget_info(
+                    budget_name=f"deployment {_model_id}",
                     budget_limit=_max_budget,
+                    time_period=_budget_duration,
                 )
                 if self.deployment_budget_config is None:
                     self.deployment_budget_config = {}
@@ -707,3 +955,25 @@ class RouterBudgetLimiting(CustomLogger):
         verbose_router_logger.debug(
             f"Initialized Deployment Budget Config: {self.deployment_budget_config}"
         )
+
+    def _init_spend_keys(self):
+        """
+        Build the spend cache keys once, instead of formatting them on every request / sync
+
+        - `_provider_spend_keys`: provider -> `provider_spend:{provider}:{time_period}`
+        - `_deployment_spend_keys`: model_id -> `deployment_spend:{model_id}:{time_period}`
+        - `_all_spend_keys`: every spend key, used for the periodic Redis sync
+        """
+        self._provider_spend_keys = {
+            provider: f"provider_spend:{provider}:{config.time_period}"
+            for provider, config in (self.provider_budget_config or {}).items()
+            if config is not None
+        }
+        self._deployment_spend_keys = {
+            model_id: f"deployment_spend:{model_id}:{config.time_period}"
+            for model_id, config in (self.deployment_budget_config or {}).items()
+            if config is not None
+        }
+        self._all_spend_keys = list(self._provider_spend_keys.values()) + list(
+            self._deployment_spend_keys.values()
+        )
@@ -5,7 +5,7 @@ litellm.Router Types - includes RouterConfig, UpdateRouterConfig, ModelInfo etc
 import datetime
 import enum
 import uuid
-from typing import Any, Dict, List, Literal, Optional, Tuple, Union
+from typing import Any, Dict, List, Literal, NamedTuple, Optional, Tuple, Union
 
 import httpx
 from pydantic import BaseModel, ConfigDict, Field
@@ -646,7 +646,9 @@ class RoutingStrategy(enum.Enum):
     PROVIDER_BUDGET_LIMITING = "provider-budget-routing"
 
 
-class GenericBudgetInfo(BaseModel):
+class GenericBudgetInfo(NamedTuple):
+    """NamedTuple, not a pydantic model - this is read on every routed request"""
+
     time_period: str  # e.g., '1d', '30d'
     budget_limit: float
 
@@ -75,6 +75,48 @@ def test_map_response_format():
     }
 
 
+def test_get_openai_compatible_provider_info_env_credentials(monkeypatch):
+    """
+    Test that env credentials are cached, and re-read after the cache is invalidated.
+    """
+    from litellm.llms.fireworks_ai.chat.transformation import (
+        _invalidate_fireworks_env_credentials,
+    )
+
+    monkeypatch.delenv("FIREWORKS_API_BASE", raising=False)
+    monkeypatch.setenv("FIREWORKS_API_KEY", "key-1")
+    _invalidate_fireworks_env_credentials()
+
+    model, api_base, api_key = fireworks._get_openai_compatible_provider_info(
+        model="llama-v3p1-8b-instruct", api_base=None, api_key=None
+    )
+    assert model == "accounts/fireworks/models/llama-v3p1-8b-instruct"
+    assert api_base == "https://api.fireworks.ai/inference/v1"
+    assert api_key == "key-1"
+
+    # explicit values take precedence over the environment
+    _, api_base, api_key = fireworks._get_openai_compatible_provider_info(
+        model="llama-v3p1-8b-instruct",
+        api_base="https://my-fireworks-proxy/v1",
+        api_key="explicit-key",
+    )
+    assert api_base == "https://my-fireworks-proxy/v1"
+    assert api_key == "explicit-key"
+
+    monkeypatch.setenv("FIREWORKS_API_KEY", "key-2")
+    _, _, api_key = fireworks._get_openai_compatible_provider_info(
+        model="llama-v3p1-8b-instruct", api_base=None, api_key=None
+    )
+    assert api_key == "key-1"
+
+    _invalidate_fireworks_env_credentials()
+    _, _, api_key = fireworks._get_openai_compatible_provider_info(
+        model="llama-v3p1-8b-instruct", api_base=None, api_key=None
+    )
+    assert api_key == "key-2"
+    _invalidate_fireworks_env_credentials()
+
+
 class TestFireworksAIChatCompletion(BaseLLMChatTest):
     def get_base_completion_call_args(self) -> dict:
         return {
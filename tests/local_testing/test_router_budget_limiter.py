@@ -22,6 +22,7 @@ import logging
 from litellm._logging import verbose_router_logger
 import litellm
 from datetime import timezone, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
 
 verbose_router_logger.setLevel(logging.DEBUG)
 
@@ -203,6 +204,233 @@ async def test_get_llm_provider_for_deployment():
     assert provider_budget._get_llm_provider_for_deployment(unknown_deployment) is None
 
 
+@pytest.mark.asyncio
+async def test_get_cached_llm_provider_for_deployment():
+    """
+    Test that the provider is resolved once per model id, and re-used on later calls
+    """
+    provider_budget = RouterBudgetLimiting(
+        router_cache=DualCache(), provider_budget_config={}
+    )
+    deployment = {
+        "litellm_params": {"model": "openai/gpt-4"},
+        "model_info": {"id": "openai-gpt-4"},
+    }
+
+    with patch.object(
+        provider_budget,
+        "_get_llm_provider_for_deployment",
+        wraps=provider_budget._get_llm_provider_for_deployment,
+    ) as mock_get_llm_provider:
+        assert (
+            provider_budget._get_cached_llm_provider_for_deployment(deployment)
+            == "openai"
+        )
+        assert (
+            provider_budget._get_cached_llm_provider_for_deployment(deployment)
+            == "openai"
+        )
+        assert mock_get_llm_provider.call_count == 1
+
+        # deployments without a model id are not cached
+        no_id_deployment = {"litellm_params": {"model": "openai/gpt-4"}}
+        provider_budget._get_cached_llm_provider_for_deployment(no_id_deployment)
+        provider_budget._get_cached_llm_provider_for_deployment(no_id_deployment)
+        assert mock_get_llm_provider.call_count == 3
+
+        # failed lookups are cached as well
+        bad_deployment = {"litellm_params": {}, "model_info": {"id": "no-model"}}
+        assert (
+            provider_budget._get_cached_llm_provider_for_deployment(bad_deployment)
+            is None
+        )
+        assert (
+            provider_budget._get_cached_llm_provider_for_deployment(bad_deployment)
+            is None
+        )
+        assert mock_get_llm_provider.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_get_cached_llm_provider_for_updated_deployment():
+    """
+    Test that a cached provider is re-resolved when the deployment's litellm_params change under the same model id (e.g. `Router.upsert_deployment`)
+    """
+    provider_budget = RouterBudgetLimiting(
+        router_cache=DualCache(), provider_budget_config={}
+    )
+    deployment = {
+        "litellm_params": {"model": "openai/gpt-4"},
+        "model_info": {"id": "gpt-4-deployment"},
+    }
+    assert (
+        provider_budget._get_cached_llm_provider_for_deployment(deployment) == "openai"
+    )
+
+    updated_deployment = {
+        "litellm_params": {
+            "model": "azure/gpt-4",
+            "api_key": "test",
+            "api_base": "test",
+        },
+        "model_info": {"id": "gpt-4-deployment"},
+    }
+    assert (
+        provider_budget._get_cached_llm_provider_for_deployment(updated_deployment)
+        == "azure"
+    )
+
+    provider_budget.remove_deployment_from_provider_cache(model_id="gpt-4-deployment")
+    assert "gpt-4-deployment" not in provider_budget._deployment_provider_cache
+
+
+@pytest.mark.asyncio
+async def test_get_cached_llm_provider_for_fixed_deployment():
+    """
+    Test that a failed provider lookup is not re-used once the deployment's litellm_params are fixed
+    """
+    provider_budget = RouterBudgetLimiting(
+        router_cache=DualCache(), provider_budget_config={}
+    )
+    misconfigured_deployment = {
+        "litellm_params": {"model": "unknown-model"},
+        "model_info": {"id": "fixed-deployment"},
+    }
+    assert (
+        provider_budget._get_cached_llm_provider_for_deployment(
+            misconfigured_deployment
+        )
+        is None
+    )
+
+    fixed_deployment = {
+        "litellm_params": {"model": "openai/gpt-4"},
+        "model_info": {"id": "fixed-deployment"},
+    }
+    assert (
+        provider_budget._get_cached_llm_provider_for_deployment(fixed_deployment)
+        == "openai"
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_ttl_seconds():
+    """
+    Test that fixed-length budget durations are parsed once, and month based durations are always re-computed
+    """
+    provider_budget = RouterBudgetLimiting(
+        router_cache=DualCache(), provider_budget_config={}
+    )
+
+    assert provider_budget._get_ttl_seconds("1d") == 86400
+    assert provider_budget._get_ttl_seconds("30s") == 30
+    assert provider_budget._ttl_seconds_by_time_period == {"1d": 86400, "30s": 30}
+
+    assert provider_budget._get_ttl_seconds("1mo") > 0
+    assert "1mo" not in provider_budget._ttl_seconds_by_time_period
+
+
+@pytest.mark.asyncio
+async def test_init_spend_keys():
+    """
+    Test that the spend cache keys are built once from the provider + deployment budget configs
+    """
+    provider_budget = RouterBudgetLimiting(
+        router_cache=DualCache(),
+        provider_budget_config={
+            "openai": {"time_period": "1d", "budget_limit": 100},
+        },
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {
+                    "model": "openai/gpt-4o",
+                    "max_budget": 10,
+                    "budget_duration": "7d",
+                },
+                "model_info": {"id": "my-gpt-4o"},
+            }
+        ],
+    )
+
+    assert provider_budget._provider_spend_keys == {
+        "openai": "provider_spend:openai:1d"
+    }
+    assert provider_budget._deployment_spend_keys == {
+        "my-gpt-4o": "deployment_spend:my-gpt-4o:7d"
+    }
+    assert provider_budget._all_spend_keys == [
+        "provider_spend:openai:1d",
+        "deployment_spend:my-gpt-4o:7d",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_init_provider_budgets_normalizes_budget_info():
+    """
+    Test that directly constructed GenericBudgetInfo entries are normalized - the NamedTuple does not coerce its fields
+    """
+    provider_budget = RouterBudgetLimiting(
+        router_cache=DualCache(),
+        provider_budget_config={
+            "openai": GenericBudgetInfo(time_period="1d", budget_limit="100"),
+        },
+    )
+
+    budget_config = provider_budget._get_budget_config_for_provider("openai")
+    assert budget_config == GenericBudgetInfo(time_period="1d", budget_limit=100.0)
+    assert isinstance(budget_config.budget_limit, float)
+
+    # filtering compares spend against the budget limit, should not raise a TypeError
+    deployments = [{"litellm_params": {"model": "openai/gpt-4"}}]
+    assert await provider_budget.async_filter_deployments(deployments) == deployments
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "budget_config",
+    [
+        {"budget_limit": 100},
+        {"time_period": "1d"},
+        {"time_period": "not-a-duration", "budget_limit": 100},
+        {"time_period": "1d", "budget_limit": "one hundred"},
+        GenericBudgetInfo(time_period=None, budget_limit=100),
+    ],
+)
+async def test_init_provider_budgets_invalid_budget_info(budget_config):
+    """
+    Test that a provider budget with a missing / invalid time_period or budget_limit is rejected on init
+    """
+    with pytest.raises(ValueError, match="provider openai"):
+        RouterBudgetLimiting(
+            router_cache=DualCache(),
+            provider_budget_config={"openai": budget_config},
+        )
+
+
+@pytest.mark.asyncio
+async def test_init_deployment_budgets_invalid_budget_duration():
+    """
+    Test that a deployment budget with an invalid budget_duration is rejected on init
+    """
+    with pytest.raises(ValueError, match="deployment my-gpt-4o"):
+        RouterBudgetLimiting(
+            router_cache=DualCache(),
+            provider_budget_config=None,
+            model_list=[
+                {
+                    "model_name": "gpt-4o",
+                    "litellm_params": {
+                        "model": "openai/gpt-4o",
+                        "max_budget": 10,
+                        "budget_duration": 7,
+                    },
+                    "model_info": {"id": "my-gpt-4o"},
+                }
+            ],
+        )
+
+
 @pytest.mark.asyncio
 async def test_get_budget_config_for_provider():
     """
@@ -303,6 +531,31 @@ async def test_prometheus_metric_tracking():
     mock_prometheus.track_provider_remaining_budget.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_track_provider_remaining_budget_prometheus_caches_logger():
+    """
+    Test that the PrometheusLogger is looked up in the callbacks until found, then re-used
+    """
+    from litellm.integrations.prometheus import PrometheusLogger
+
+    provider_budget = RouterBudgetLimiting(
+        router_cache=DualCache(), provider_budget_config={}
+    )
+    mock_prometheus = MagicMock(spec=PrometheusLogger)
+
+    with patch(
+        "litellm.router_strategy.budget_limiter._get_prometheus_logger_from_callbacks",
+        side_effect=[None, mock_prometheus],
+    ) as mock_get_logger:
+        for _ in range(3):
+            provider_budget._track_provider_remaining_budget_prometheus(
+                provider="openai", spend=1.0, budget_limit=10.0
+            )
+
+    assert mock_get_logger.call_count == 2
+    assert mock_prometheus.track_provider_remaining_budget.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_handle_new_budget_window():
     """
@@ -419,15 +672,248 @@ async def test_increment_spend_in_current_window():
 
     # Verify the increment operation was queued for Redis
     print(
-        "redis_increment_operation_queue",
-        provider_budget.redis_increment_operation_queue,
+        "redis_pending_increments",
+        provider_budget.redis_pending_increments,
     )
-    assert len(provider_budget.redis_increment_operation_queue) == 1
-    queued_op = provider_budget.redis_increment_operation_queue[0]
+    assert len(provider_budget.redis_pending_increments) == 1
+    queued_op = provider_budget.redis_pending_increments[spend_key]
     assert queued_op["key"] == spend_key
     assert queued_op["increment_value"] == response_cost
     assert queued_op["ttl"] == ttl
 
+    # Verify increments for the same key are accumulated into 1 operation, with the latest ttl
+    await provider_budget._increment_spend_in_current_window(
+        spend_key=spend_key,
+        response_cost=response_cost,
+        ttl=ttl - 10,
+    )
+    assert len(provider_budget.redis_pending_increments) == 1
+    queued_op = provider_budget.redis_pending_increments[spend_key]
+    assert queued_op["increment_value"] == response_cost * 2
+    assert queued_op["ttl"] == ttl - 10
+
+
+@pytest.mark.asyncio
+async def test_async_filter_deployments_skips_unbudgeted_deployments():
+    """
+    Test that no provider lookup / spend read happens when no budget applies to the deployments
+    """
+    healthy_deployments = [
+        {
+            "model_name": "gpt-4o",
+            "litellm_params": {"model": "openai/gpt-4o"},
+            "model_info": {"id": "openai-gpt-4o"},
+        }
+    ]
+
+    # no budgets configured - return early
+    provider_budget = RouterBudgetLimiting(
+        router_cache=DualCache(), provider_budget_config={}
+    )
+    with patch.object(
+        provider_budget, "_get_cached_llm_provider_for_deployment"
+    ) as mock_get_provider:
+        assert (
+            await provider_budget.async_filter_deployments(
+                healthy_deployments=healthy_deployments
+            )
+            == healthy_deployments
+        )
+        mock_get_provider.assert_not_called()
+
+    # budget only configured for another provider - no spend read
+    provider_budget = RouterBudgetLimiting(
+        router_cache=DualCache(),
+        provider_budget_config={
+            "anthropic": GenericBudgetInfo(time_period="1d", budget_limit=100),
+        },
+    )
+    with patch.object(
+        provider_budget.router_cache, "async_batch_get_cache"
+    ) as mock_batch_get_cache:
+        assert (
+            await provider_budget.async_filter_deployments(
+                healthy_deployments=healthy_deployments
+            )
+            == healthy_deployments
+        )
+        mock_batch_get_cache.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_current_spends_reuses_snapshot():
+    """
+    Test that concurrent spend reads for the same keys share one cache read,
+    and that the snapshot is dropped once spend is incremented
+    """
+    provider_budget = RouterBudgetLimiting(
+        router_cache=DualCache(),
+        provider_budget_config={
+            "openai": GenericBudgetInfo(time_period="1d", budget_limit=100),
+        },
+    )
+    cache_keys = ["provider_spend:openai:1d"]
+    await provider_budget.router_cache.async_set_cache(key=cache_keys[0], value=1.0)
+
+    with patch.object(
+        provider_budget.router_cache,
+        "async_batch_get_cache",
+        wraps=provider_budget.router_cache.async_batch_get_cache,
+    ) as mock_batch_get_cache:
+        results = await asyncio.gather(
+            *[
+                provider_budget._get_current_spends(
+                    cache_keys=cache_keys, parent_otel_span=None
+                )
+                for _ in range(5)
+            ]
+        )
+        assert all(float(result[0]) == 1.0 for result in results)
+        assert mock_batch_get_cache.call_count == 1
+
+        await provider_budget.async_log_success_event(
+            kwargs={
+                "standard_logging_object": {"response_cost": 0.5, "model_id": ""},
+                "litellm_params": {"custom_llm_provider": "openai"},
+            },
+            response_obj=None,
+            start_time=None,
+            end_time=None,
+        )
+        await provider_budget._get_current_spends(
+            cache_keys=cache_keys, parent_otel_span=None
+        )
+        assert mock_batch_get_cache.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_current_spends_key_order():
+    """
+    Test that the same keys in a different order share one snapshot, and spends are returned in the caller's key order
+    """
+    provider_budget = RouterBudgetLimiting(
+        router_cache=DualCache(), provider_budget_config={}
+    )
+    await provider_budget.router_cache.async_set_cache(
+        key="provider_spend:openai:1d", value=1.0
+    )
+    await provider_budget.router_cache.async_set_cache(
+        key="provider_spend:anthropic:1d", value=2.0
+    )
+
+    with patch.object(
+        provider_budget.router_cache,
+        "async_batch_get_cache",
+        wraps=provider_budget.router_cache.async_batch_get_cache,
+    ) as mock_batch_get_cache:
+        spends = await provider_budget._get_current_spends(
+            cache_keys=["provider_spend:openai:1d", "provider_spend:anthropic:1d"],
+            parent_otel_span=None,
+        )
+        assert [float(spend) for spend in spends] == [1.0, 2.0]
+
+        spends = await provider_budget._get_current_spends(
+            cache_keys=["provider_spend:anthropic:1d", "provider_spend:openai:1d"],
+            parent_otel_span=None,
+        )
+        assert [float(spend) for spend in spends] == [2.0, 1.0]
+        assert mock_batch_get_cache.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_current_spends_different_keys_do_not_wait():
+    """
+    Test that spend reads for different keys run concurrently, and only reads for the same keys are shared
+    """
+    provider_budget = RouterBudgetLimiting(
+        router_cache=DualCache(), provider_budget_config={}
+    )
+    in_flight_reads = 0
+    max_in_flight_reads = 0
+
+    async def slow_batch_get_cache(keys, parent_otel_span=None):
+        nonlocal in_flight_reads, max_in_flight_reads
+        in_flight_reads += 1
+        max_in_flight_reads = max(max_in_flight_reads, in_flight_reads)
+        await asyncio.sleep(0.01)
+        in_flight_reads -= 1
+        return [1.0] * len(keys)
+
+    with patch.object(
+        provider_budget.router_cache,
+        "async_batch_get_cache",
+        side_effect=slow_batch_get_cache,
+    ) as mock_batch_get_cache:
+        await asyncio.gather(
+            provider_budget._get_current_spends(
+                cache_keys=["provider_spend:openai:1d"], parent_otel_span=None
+            ),
+            provider_budget._get_current_spends(
+                cache_keys=["provider_spend:openai:1d"], parent_otel_span=None
+            ),
+            provider_budget._get_current_spends(
+                cache_keys=["provider_spend:anthropic:1d"], parent_otel_span=None
+            ),
+        )
+        assert mock_batch_get_cache.call_count == 2
+        assert max_in_flight_reads == 2
+    assert provider_budget._in_flight_spend_reads == {}
+
+
+@pytest.mark.asyncio
+async def test_spend_snapshot_not_stale_after_slow_increment():
+    """
+    Test that a filter running while a success event is awaiting a (slow) cache read
+    does not leave a snapshot of the pre-increment spend behind
+    """
+    provider_budget = RouterBudgetLimiting(
+        router_cache=DualCache(),
+        provider_budget_config={
+            "openai": GenericBudgetInfo(time_period="1d", budget_limit=10),
+        },
+    )
+    router_cache = provider_budget.router_cache
+    await router_cache.async_set_cache(key="provider_spend:openai:1d", value=9.0)
+    await router_cache.async_set_cache(
+        key="provider_budget_start_time:openai",
+        value=datetime.now(timezone.utc).timestamp(),
+    )
+    deployments = [
+        {"litellm_params": {"model": "openai/gpt-4"}, "model_info": {"id": "gpt-4"}}
+    ]
+
+    async_get_cache = router_cache.async_get_cache
+
+    async def slow_async_get_cache(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return await async_get_cache(*args, **kwargs)
+
+    with patch.object(
+        router_cache, "async_get_cache", side_effect=slow_async_get_cache
+    ):
+        log_task = asyncio.create_task(
+            provider_budget.async_log_success_event(
+                kwargs={
+                    "standard_logging_object": {"response_cost": 5, "model_id": ""},
+                    "litellm_params": {"custom_llm_provider": "openai"},
+                },
+                response_obj=None,
+                start_time=None,
+                end_time=None,
+            )
+        )
+        await asyncio.sleep(0)
+        # success event is waiting on the budget start time - spend is still under budget
+        assert (
+            await provider_budget.async_filter_deployments(deployments) == deployments
+        )
+        await log_task
+
+    # spend is now 14 > 10, the pre-increment snapshot must not be re-used
+    with pytest.raises(ValueError) as e:
+        await provider_budget.async_filter_deployments(deployments)
+    assert "Exceeded budget for provider openai" in str(e.value)
+
 
 @pytest.mark.asyncio
 async def test_sync_in_memory_spend_with_redis():
@@ -483,6 +969,165 @@ async def test_sync_in_memory_spend_with_redis():
     assert float(anthropic_spend) == 75.0
 
 
+@pytest.mark.asyncio
+async def test_sync_in_memory_spend_with_mock_redis():
+    """
+    Test _sync_in_memory_spend_with_redis without a live Redis
+
+    - pending increments are pushed in 1 pipeline call, 1 operation per key
+    - redis values are written to the in-memory cache
+    """
+    mock_redis_cache = MagicMock()
+    mock_redis_cache.async_increment_pipeline = AsyncMock(return_value=None)
+    mock_redis_cache.async_batch_get_cache = AsyncMock(
+        return_value={"provider_spend:openai:1d": "50.0"}
+    )
+    router_cache = DualCache()
+    router_cache.redis_cache = mock_redis_cache
+
+    provider_budget = RouterBudgetLimiting(
+        router_cache=router_cache,
+        provider_budget_config={
+            "openai": GenericBudgetInfo(time_period="1d", budget_limit=100),
+        },
+    )
+    for _ in range(3):
+        await provider_budget._increment_spend_in_current_window(
+            spend_key="provider_spend:openai:1d", response_cost=1.0, ttl=100
+        )
+
+    await provider_budget._sync_in_memory_spend_with_redis()
+
+    mock_redis_cache.async_increment_pipeline.assert_called_once()
+    increment_list = mock_redis_cache.async_increment_pipeline.call_args.kwargs[
+        "increment_list"
+    ]
+    assert increment_list == [
+        {"key": "provider_spend:openai:1d", "increment_value": 3.0, "ttl": 100}
+    ]
+    assert provider_budget.redis_pending_increments == {}
+    assert (
+        await router_cache.in_memory_cache.async_get_cache("provider_spend:openai:1d")
+        == 50.0
+    )
+
+
+@pytest.mark.asyncio
+async def test_push_in_memory_increments_to_redis_requeues_on_failure():
+    """
+    Test that increments are not lost when the Redis pipeline fails,
+    and that increments still queued are kept in the in-memory spend after a sync
+    """
+    mock_redis_cache = MagicMock()
+    mock_redis_cache.async_increment_pipeline = AsyncMock(
+        side_effect=Exception("redis is down")
+    )
+    mock_redis_cache.async_batch_get_cache = AsyncMock(
+        return_value={"provider_spend:openai:1d": "50.0"}
+    )
+    router_cache = DualCache()
+    router_cache.redis_cache = mock_redis_cache
+
+    provider_budget = RouterBudgetLimiting(
+        router_cache=router_cache,
+        provider_budget_config={
+            "openai": GenericBudgetInfo(time_period="1d", budget_limit=100),
+        },
+    )
+    for _ in range(2):
+        await provider_budget._increment_spend_in_current_window(
+            spend_key="provider_spend:openai:1d", response_cost=1.0, ttl=100
+        )
+
+    await provider_budget._sync_in_memory_spend_with_redis()
+
+    assert provider_budget.redis_pending_increments == {
+        "provider_spend:openai:1d": {
+            "key": "provider_spend:openai:1d",
+            "increment_value": 2.0,
+            "ttl": 100,
+        }
+    }
+    # redis spend + increments that could not be pushed yet
+    assert (
+        await router_cache.in_memory_cache.async_get_cache("provider_spend:openai:1d")
+        == 52.0
+    )
+
+    # spend logged while a failing push is in flight is merged with the re-queued increment
+    async def _log_spend_then_fail(**kwargs):
+        await provider_budget._increment_spend_in_current_window(
+            spend_key="provider_spend:openai:1d", response_cost=1.0, ttl=90
+        )
+        raise Exception("redis is down")
+
+    mock_redis_cache.async_increment_pipeline = AsyncMock(
+        side_effect=_log_spend_then_fail
+    )
+    await provider_budget._push_in_memory_increments_to_redis()
+    assert provider_budget.redis_pending_increments == {
+        "provider_spend:openai:1d": {
+            "key": "provider_spend:openai:1d",
+            "increment_value": 3.0,
+            "ttl": 90,
+        }
+    }
+
+    # next sync succeeds - queued increments are pushed once
+    mock_redis_cache.async_increment_pipeline = AsyncMock(return_value=None)
+    await provider_budget._push_in_memory_increments_to_redis()
+    mock_redis_cache.async_increment_pipeline.assert_called_once_with(
+        increment_list=[
+            {"key": "provider_spend:openai:1d", "increment_value": 3.0, "ttl": 90}
+        ]
+    )
+    assert provider_budget.redis_pending_increments == {}
+
+
+@pytest.mark.asyncio
+async def test_push_in_memory_increments_to_redis_requeues_on_cancel():
+    """
+    Test that increments are re-queued if the sync task is cancelled while the pipeline is in flight
+    """
+    pipeline_started = asyncio.Event()
+
+    async def _slow_increment_pipeline(**kwargs):
+        pipeline_started.set()
+        await asyncio.sleep(10)
+
+    mock_redis_cache = MagicMock()
+    mock_redis_cache.async_increment_pipeline = AsyncMock(
+        side_effect=_slow_increment_pipeline
+    )
+    router_cache = DualCache()
+
+    provider_budget = RouterBudgetLimiting(
+        router_cache=router_cache, provider_budget_config={}
+    )
+    # let the first periodic sync run before Redis is set, so it doesn't push the increment below
+    await asyncio.sleep(0)
+    router_cache.redis_cache = mock_redis_cache
+    await provider_budget._increment_spend_in_current_window(
+        spend_key="provider_spend:openai:1d", response_cost=1.0, ttl=100
+    )
+
+    push_task = asyncio.create_task(
+        provider_budget._push_in_memory_increments_to_redis()
+    )
+    await pipeline_started.wait()
+    push_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await push_task
+
+    assert provider_budget.redis_pending_increments == {
+        "provider_spend:openai:1d": {
+            "key": "provider_spend:openai:1d",
+            "increment_value": 1.0,
+            "ttl": 100,
+        }
+    }
+
+
 @pytest.mark.asyncio
 async def test_get_current_provider_spend():
     """